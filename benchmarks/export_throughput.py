@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grade_calculator_app.models import GradeManager, Semester, Course
+from grade_calculator_app import exporter
+
+def build_synthetic_history(course_rows: int, courses_per_semester: int = 8, years: int = 8) -> GradeManager:
+    # Semesters share one pool of Course objects so multi-million-row
+    # histories fit in memory; the exporter still walks every row.
+    grades = list(Course.GRADE_VALUES.keys())
+    pool = [Course(f"{1000000 + i:08d} Course {i}", float(1 + i % 4), grades[i % len(grades)])
+            for i in range(courses_per_semester * 16)]
+
+    grade_manager = GradeManager()
+    semester_count = course_rows // courses_per_semester
+    for i in range(semester_count):
+        start = (i * courses_per_semester) % (len(pool) - courses_per_semester)
+        # Years in ascending order, so every add appends to the end of the series
+        year = f"Year {i * years // semester_count + 1}"
+        grade_manager.add_semester(Semester(f"Semester {i + 1}", year, pool[start:start + courses_per_semester]))
+    return grade_manager
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure export throughput on a synthetic history")
+    parser.add_argument("--rows", type=int, default=2000000, help="Number of course rows")
+    parser.add_argument("--chunk-size", type=int, default=exporter.DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    grade_manager = build_synthetic_history(args.rows)
+    print(f"Built {args.rows} course rows in {time.perf_counter() - started:.1f}s")
+
+    formats = ["csv", "jsonl"] + (["parquet"] if exporter.pa is not None else [])
+    with tempfile.TemporaryDirectory() as tmp:
+        for level in exporter.LEVELS:
+            for fmt in formats:
+                path = os.path.join(tmp, f"{level}.{fmt}")
+                started = time.perf_counter()
+                count = exporter.export(grade_manager, path, fmt, level, args.chunk_size)
+                elapsed = time.perf_counter() - started
+                size_mb = os.path.getsize(path) / 1e6
+                print(f"{level:>8} {fmt:>7}: {count:>9} rows in {elapsed:6.2f}s "
+                      f"({count / elapsed:>10,.0f} rows/s, {size_mb:7.1f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import pandas as pd
+from typing import Dict, List, Optional, Set, Tuple
+from .models import GradeManager, Semester, Course
+
+class GradeAnalytics:
+    KNOWN_GRADES: List[str] = list(Course.GRADE_VALUES.keys())
+    GRADE_DTYPE = pd.CategoricalDtype(KNOWN_GRADES, ordered=True)
+
+    def __init__(self, grade_manager: GradeManager):
+        self.grade_manager = grade_manager
+        self._revision = None
+        self._courses: Optional[pd.DataFrame] = None
+        self._semesters: Optional[pd.DataFrame] = None
+        # Per-semester course columns (names, credits, grades, points) keyed by
+        # object identity, with any grades outside Course.GRADE_VALUES they
+        # contain. Unchanged semesters reuse their lists; the combined frame is
+        # built with a single constructor call, since per-semester frames and
+        # pd.concat cost far more than materializing everything at once.
+        self._columns: Dict[int, Tuple[Semester, Tuple[List, List, List, List], Set[str]]] = {}
+
+    def _semester_columns(self, semester: Semester) -> Tuple[Semester, Tuple[List, List, List, List], Set[str]]:
+        cached = self._columns.get(id(semester))
+        if cached is not None and cached[0] is semester:
+            return cached
+
+        courses = semester.courses
+        grades = [c.grade for c in courses]
+        columns = (
+            [c.name for c in courses],
+            [c.credits for c in courses],
+            grades,
+            [c.points for c in courses],
+        )
+        unknown = {g for g in grades if g and g not in Course.GRADE_VALUES}
+        cached = (semester, columns, unknown)
+        self._columns[id(semester)] = cached
+        return cached
+
+    def _refresh(self):
+        if self._revision == self.grade_manager.revision:
+            return
+
+        semesters = self.grade_manager.get_semesters()
+        # Totals GradeManager already maintains, so no course is re-scanned here
+        totals = self.grade_manager.get_semester_totals()
+        year_dtype = pd.CategoricalDtype(sorted(self.grade_manager.semesters_by_year.keys()), ordered=True)
+
+        positions, years, names = [], [], []
+        course_names, credits, grades, points = [], [], [], []
+        unknown_grades = set()
+        live = {}
+        for position, semester in enumerate(semesters):
+            cached = self._semester_columns(semester)
+            live[id(semester)] = cached
+            c_names, c_credits, c_grades, c_points = cached[1]
+            count = len(c_names)
+            positions.extend([position] * count)
+            years.extend([semester.year] * count)
+            names.extend([semester.name] * count)
+            course_names.extend(c_names)
+            credits.extend(c_credits)
+            grades.extend(c_grades)
+            points.extend(c_points)
+            unknown_grades |= cached[2]
+        # Drop columns of semesters that were replaced or deleted
+        self._columns = live
+
+        grade_dtype = self.GRADE_DTYPE
+        if unknown_grades:
+            grade_dtype = pd.CategoricalDtype(self.KNOWN_GRADES + sorted(unknown_grades), ordered=True)
+
+        courses = pd.DataFrame({
+            "position": pd.array(positions, dtype="int64"),
+            "year": pd.Categorical(years, dtype=year_dtype),
+            "semester": pd.Series(names, dtype="object"),
+            "course": pd.Series(course_names, dtype="object"),
+            "credits": pd.Series(credits, dtype="float64"),
+            "grade": pd.Categorical(grades, dtype=grade_dtype),
+            "points": pd.Series(points, dtype="float64"),
+        })
+
+        semester_frame = pd.DataFrame({
+            "position": range(len(semesters)),
+            "year": [s.year for s in semesters],
+            "semester": [s.name for s in semesters],
+            "points": [p for p, _ in totals],
+            "credits": [c for _, c in totals],
+        })
+        semester_frame = semester_frame.astype({
+            "position": "int64",
+            "year": year_dtype,
+            "semester": "object",
+            "points": "float64",
+            "credits": "float64",
+        })
+        semester_frame["gpa"] = (semester_frame["points"] / semester_frame["credits"]).where(semester_frame["credits"] > 0, 0.0)
+
+        self._courses = courses
+        self._semesters = semester_frame
+        self._revision = self.grade_manager.revision
+
+    @property
+    def courses(self) -> pd.DataFrame:
+        # One row per course: position, year, semester, course, credits, grade, points
+        self._refresh()
+        return self._courses
+
+    @property
+    def semesters(self) -> pd.DataFrame:
+        # One row per semester: position, year, semester, points, credits, gpa
+        self._refresh()
+        return self._semesters
+
+    def grade_distribution(self, year: Optional[str] = None) -> pd.Series:
+        courses = self.courses
+        if year is not None:
+            courses = courses[courses["year"] == year]
+        counts = courses["grade"].value_counts(sort=False)
+        return counts[counts > 0]
+
+    def grade_distribution_by_year(self) -> pd.DataFrame:
+        courses = self.courses
+        return pd.crosstab(courses["year"], courses["grade"])
+
+    def gpa_by_year(self) -> pd.Series:
+        totals = self.semesters.groupby("year", observed=True)[["points", "credits"]].sum()
+        totals = totals[totals["credits"] > 0]
+        return totals["points"] / totals["credits"]
+
+    def semester_gpas(self, year: Optional[str] = None) -> pd.DataFrame:
+        semesters = self.semesters
+        if year is not None:
+            semesters = semesters[semesters["year"] == year]
+        return semesters
+
+    def gpa_by_code_prefix(self, length: int = 3) -> pd.Series:
+        # Course names from the importer look like "01999021 English Name"
+        courses = self.courses.dropna(subset=["points"])
+        prefix = courses["course"].str.extract(r"^\s*([A-Za-z0-9]+)", expand=False).str[:length]
+        weighted = pd.DataFrame({
+            "prefix": prefix,
+            "points": courses["points"] * courses["credits"],
+            "credits": courses["credits"],
+        })
+        totals = weighted.groupby("prefix")[["points", "credits"]].sum()
+        totals = totals[totals["credits"] > 0]
+        return totals["points"] / totals["credits"]
+
+    def best_semesters(self, n: int = 3) -> pd.DataFrame:
+        graded = self.semesters[self.semesters["credits"] > 0]
+        return graded.nlargest(n, "gpa")
+
+    def worst_semesters(self, n: int = 3) -> pd.DataFrame:
+        graded = self.semesters[self.semesters["credits"] > 0]
+        return graded.nsmallest(n, "gpa")
@@ -1,11 +1,58 @@
+import hashlib
 import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Callable, Dict, Any, Optional, Tuple
+
+# Raised by save_data when the file was changed by another writer since it was last loaded or saved
+class DataConflictError(Exception):
+    pass
 
 class DataManager:
     def __init__(self, filepath: str, settings_filepath: str = "settings.json"):
         self.filepath = filepath
         self.settings_filepath = settings_filepath
+        # (mtime_ns, size, sha256) of the data file as this instance last read or wrote it
+        self._signature: Optional[Tuple[int, int, str]] = None
+        # Set when load_data found a data file it could not parse
+        self.load_error: Optional[str] = None
+        self._lock = threading.RLock()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.filepath)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _remember(self, raw: bytes, stat: Optional[Tuple[int, int]] = None):
+        if stat is None:
+            stat = self._stat()
+        if stat is not None:
+            self._signature = (stat[0], stat[1], hashlib.sha256(raw).hexdigest())
+
+    def _read_if_changed(self) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        # Cheap stat on every call; the file is only read and hashed when mtime or size moved
+        stat = self._stat()
+        if stat is None:
+            return None
+        if self._signature is not None and stat == self._signature[:2]:
+            return None
+        with open(self.filepath, "rb") as f:
+            raw = f.read()
+        if self._signature is not None and hashlib.sha256(raw).hexdigest() == self._signature[2]:
+            # Touched but not modified
+            self._remember(raw, stat)
+            return None
+        return raw, stat
+
+    @staticmethod
+    def _parse(raw: bytes) -> Dict[str, Any]:
+        data = json.loads(raw)
+        # Migrate old list format to new dict format if necessary
+        if isinstance(data, list):
+            return {"Year 1": data}
+        return data
 
     def save_settings(self, settings: Dict[str, Any]):
         try:
@@ -24,24 +71,90 @@ class DataManager:
                 return {}
         return {}
 
-    def save_data(self, data: Dict[str, Any]):
+    def save_data(self, data: Dict[str, Any], force: bool = False):
+        with self._lock:
+            if not force and self._read_if_changed() is not None:
+                raise DataConflictError(f"{self.filepath} was modified by another program")
+            try:
+                raw = json.dumps(data, indent=4).encode("utf-8")
+                # Write a temp file and swap it in: readers never see a partial
+                # document, and the signature comes from our own file rather than
+                # whatever is at the path after the write
+                tmp_path = self.filepath + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    st = os.fstat(f.fileno())
+                os.replace(tmp_path, self.filepath)
+                self._remember(raw, (st.st_mtime_ns, st.st_size))
+            except Exception as e:
+                print(f"Error saving data: {e}")
+                raise e
+
+    def poll_external_changes(self) -> Optional[Tuple[Dict[str, Any], Callable[[], None]]]:
+        # Returns (document, commit) if another writer changed the file, else None.
+        # Call commit() only once the document has been applied; until then the
+        # change stays unseen, so polls report it again and save_data refuses to
+        # overwrite it.
+        with self._lock:
+            changed = self._read_if_changed()
+            if changed is None:
+                return None
+            raw, stat = changed
+            try:
+                data = self._parse(raw)
+            except Exception as e:
+                # Most likely caught mid-write; try again on the next poll
+                print(f"Error reading changed data: {e}")
+                return None
+
+            def commit():
+                with self._lock:
+                    self._remember(raw, stat)
+
+            return data, commit
+
+    def export_data(self, grade_manager, path: str, fmt: str = "csv", level: str = "course") -> int:
+        # Streams rows from the in-memory history; see exporter.py for the formats
+        from .exporter import export
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(data, f, indent=4)
+            return export(grade_manager, path, fmt, level)
         except Exception as e:
-            print(f"Error saving data: {e}")
+            print(f"Error exporting data: {e}")
             raise e
 
+    def _read_raw(self) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+        stat = self._stat()
+        with open(self.filepath, "rb") as f:
+            return f.read(), stat
+
+    def read_data(self) -> Dict[str, Any]:
+        # Like load_data, but raises (OSError, ValueError) instead of returning {}
+        with self._lock:
+            raw, stat = self._read_raw()
+            data = self._parse(raw)
+            self._remember(raw, stat)
+            return data
+
     def load_data(self) -> Dict[str, Any]:
+        self.load_error = None
         if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, "r") as f:
-                    data = json.load(f)
-                    # Migrate old list format to new dict format if necessary
-                    if isinstance(data, list):
-                        return {"Year 1": data}
-                    return data
-            except Exception as e:
-                print(f"Error loading data: {e}")
-                return {}
+            with self._lock:
+                try:
+                    raw, stat = self._read_raw()
+                except Exception as e:
+                    print(f"Error loading data: {e}")
+                    return {}
+                try:
+                    data = self._parse(raw)
+                except Exception as e:
+                    print(f"Error loading data: {e}")
+                    self.load_error = str(e)
+                    # Count the unreadable contents as seen, so the next save
+                    # replaces them instead of reporting a conflict forever
+                    self._remember(raw, stat)
+                    return {}
+                self._remember(raw, stat)
+                return data
         return {}
@@ -0,0 +1,133 @@
+import argparse
+import csv
+import json
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .models import GradeManager
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+DEFAULT_CHUNK_SIZE = 10000
+FORMATS = ("csv", "jsonl", "parquet")
+LEVELS = ("course", "semester")
+
+COURSE_FIELDS = ["year", "semester", "course", "credits", "grade", "points"]
+SEMESTER_FIELDS = ["year", "semester", "courses", "credits", "points", "gpa", "cumulative_gpa"]
+
+def iter_course_rows(grade_manager: GradeManager) -> Iterator[Tuple]:
+    for semester in grade_manager.get_semesters():
+        for course in semester.courses:
+            yield (semester.year, semester.name, course.name, float(course.credits), course.grade, course.points)
+
+def iter_semester_rows(grade_manager: GradeManager) -> Iterator[Tuple]:
+    # Totals come from the same per-semester values as the cumulative series
+    totals = grade_manager.get_semester_totals()
+    for position, semester in enumerate(grade_manager.get_semesters()):
+        points, credits = totals[position]
+        gpa = (points / credits) if credits > 0 else 0.0
+        yield (semester.year, semester.name, len(semester.courses), credits, points, gpa,
+               grade_manager.get_cumulative_gpa_at(position))
+
+def iter_chunks(rows: Iterable[Tuple], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple]]:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def write_csv(rows: Iterable[Tuple], fields: List[str], path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for chunk in iter_chunks(rows, chunk_size):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+def write_jsonl(rows: Iterable[Tuple], fields: List[str], path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in iter_chunks(rows, chunk_size):
+            f.write("".join(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + "\n" for row in chunk))
+            count += len(chunk)
+    return count
+
+def _parquet_schema(fields: List[str]):
+    types = {
+        "year": pa.string(), "semester": pa.string(), "course": pa.string(), "grade": pa.string(),
+        "courses": pa.int64(), "credits": pa.float64(), "points": pa.float64(),
+        "gpa": pa.float64(), "cumulative_gpa": pa.float64(),
+    }
+    return pa.schema([(name, types[name]) for name in fields])
+
+def write_parquet(rows: Iterable[Tuple], fields: List[str], path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    if pa is None:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = _parquet_schema(fields)
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in iter_chunks(rows, chunk_size):
+            columns = [list(column) for column in zip(*chunk)]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            count += len(chunk)
+    return count
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "parquet": write_parquet}
+
+def export(grade_manager: GradeManager, path: str, fmt: str = "csv", level: str = "course",
+           chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if level == "course":
+        rows, fields = iter_course_rows(grade_manager), COURSE_FIELDS
+    elif level == "semester":
+        rows, fields = iter_semester_rows(grade_manager), SEMESTER_FIELDS
+    else:
+        raise ValueError(f"Unknown export level: {level}")
+    return WRITERS[fmt](rows, fields, path, chunk_size)
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def main(argv: Optional[List[str]] = None):
+    from .data_manager import DataManager
+
+    parser = argparse.ArgumentParser(description="Export saved grades to CSV, JSONL or Parquet")
+    parser.add_argument("output", help="Output file path")
+    parser.add_argument("--data", default="grade_data.json", help="Grade data file (default: grade_data.json)")
+    parser.add_argument("--format", choices=FORMATS, help="Output format (default: from the output extension)")
+    parser.add_argument("--level", choices=LEVELS, default="course", help="One row per course or per semester")
+    parser.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or args.output.rsplit(".", 1)[-1].lower()
+    if fmt not in FORMATS:
+        parser.error(f"Cannot infer format from {args.output!r}; pass --format")
+
+    grade_manager = GradeManager()
+    try:
+        grade_manager.load_data(DataManager(args.data).read_data())
+    except FileNotFoundError:
+        parser.error(f"Data file not found: {args.data}")
+    except Exception as e:
+        parser.error(f"Cannot read data file {args.data}: {e}")
+    count = export(grade_manager, args.output, fmt, args.level, args.chunk_size)
+    print(f"Exported {count} {args.level} rows to {args.output}")
+
+if __name__ == "__main__":
+    main()
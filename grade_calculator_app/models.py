@@ -1,4 +1,5 @@
-from typing import List, Dict, Optional
+import math
+from typing import Any, List, Dict, Optional, Tuple
 
 class Course:
     GRADE_VALUES = {
@@ -51,6 +52,9 @@ class Semester:
             "courses": [c.to_dict() for c in self.courses]
         }
 
+    def content_key(self):
+        return self.name, [(c.name, float(c.credits), c.grade) for c in self.courses]
+
     @classmethod
     def from_dict(cls, data: dict, year: str):
         semester = cls(data['name'], year)
@@ -58,15 +62,110 @@ class Semester:
             semester.add_course(Course(c_data['name'], float(c_data['credits']), c_data['grade']))
         return semester
 
+class GPAAccumulator:
+    def __init__(self):
+        # Structure: { key: (points x credits, credits) } per entry, plus running totals,
+        # so changing one entry only applies its delta
+        self.contributions: Dict[Any, Tuple[float, float]] = {}
+        self.total_points = 0.0
+        self.total_credits = 0.0
+
+    def set(self, key: Any, credits: float, grade: Optional[str]):
+        points = Course.GRADE_VALUES.get(grade)
+        if points is None or not math.isfinite(credits):
+            new = (0.0, 0.0)
+        else:
+            new = (points * credits, credits)
+        old = self.contributions.get(key, (0.0, 0.0))
+        self.contributions[key] = new
+        self.total_points += new[0] - old[0]
+        self.total_credits += new[1] - old[1]
+
+    def remove(self, key: Any):
+        old = self.contributions.pop(key, None)
+        if old is not None:
+            self.total_points -= old[0]
+            self.total_credits -= old[1]
+        if not self.contributions:
+            # Reset so float drift doesn't survive an empty form
+            self.clear()
+
+    def clear(self):
+        self.contributions.clear()
+        self.total_points = 0.0
+        self.total_credits = 0.0
+
+    @property
+    def gpa(self) -> float:
+        # Tolerance absorbs the rounding left behind by add/subtract deltas
+        return (self.total_points / self.total_credits) if self.total_credits > 1e-9 else 0.0
+
 class GradeManager:
     def __init__(self):
         # Structure: { "Year 1": [SemesterObj, ...], ... }
         self.semesters_by_year: Dict[str, List[Semester]] = {}
+        # Chronological view of all semesters (years sorted, then saved order)
+        # with prefix sums of points and credits, so the running cumulative
+        # GPA after any semester is an O(1) lookup.
+        self._timeline: List[Semester] = []
+        self._semester_totals: List[Tuple[float, float]] = []
+        self._cum_points: List[float] = []
+        self._cum_credits: List[float] = []
+        # Bumped on every mutation so derived views (e.g. analytics) know when to refresh
+        self.revision = 0
+
+    def _timeline_position(self, year: str, index: int) -> int:
+        position = 0
+        for y in sorted(self.semesters_by_year.keys()):
+            if y == year:
+                return position + index
+            position += len(self.semesters_by_year[y])
+        return position
+
+    def _refresh_series_from(self, position: int):
+        # Every mutation ends here, so this is also where the revision moves
+        self.revision += 1
+        # Only the suffix starting at `position` depends on the change
+        del self._cum_points[position:]
+        del self._cum_credits[position:]
+        cum_points = self._cum_points[-1] if self._cum_points else 0.0
+        cum_credits = self._cum_credits[-1] if self._cum_credits else 0.0
+        for points, credits in self._semester_totals[position:]:
+            cum_points += points
+            cum_credits += credits
+            self._cum_points.append(cum_points)
+            self._cum_credits.append(cum_credits)
+
+    def _insert_into_series(self, position: int, semester: Semester):
+        _, points, credits = semester.calculate_stats()
+        self._timeline.insert(position, semester)
+        self._semester_totals.insert(position, (points, credits))
+        self._refresh_series_from(position)
+
+    def _remove_from_series(self, position: int):
+        del self._timeline[position]
+        del self._semester_totals[position]
+        self._refresh_series_from(position)
+
+    def _rebuild_series(self):
+        self._timeline = []
+        self._semester_totals = []
+        for year in sorted(self.semesters_by_year.keys()):
+            for s in self.semesters_by_year[year]:
+                _, points, credits = s.calculate_stats()
+                self._timeline.append(s)
+                self._semester_totals.append((points, credits))
+        self._cum_points = []
+        self._cum_credits = []
+        self._refresh_series_from(0)
 
     def add_semester(self, semester: Semester):
         if semester.year not in self.semesters_by_year:
             self.semesters_by_year[semester.year] = []
-        self.semesters_by_year[semester.year].append(semester)
+        semesters = self.semesters_by_year[semester.year]
+        position = self._timeline_position(semester.year, len(semesters))
+        semesters.append(semester)
+        self._insert_into_series(position, semester)
 
     def update_semester(self, new_semester: Semester, old_year: str, index: int):
         # If year changed, remove from old year list
@@ -77,22 +176,57 @@ class GradeManager:
             # Update in place
             if old_year in self.semesters_by_year and 0 <= index < len(self.semesters_by_year[old_year]):
                 self.semesters_by_year[old_year][index] = new_semester
+                position = self._timeline_position(old_year, index)
+                _, points, credits = new_semester.calculate_stats()
+                self._timeline[position] = new_semester
+                self._semester_totals[position] = (points, credits)
+                self._refresh_series_from(position)
 
     def delete_semester(self, year: str, index: int):
         if year in self.semesters_by_year and 0 <= index < len(self.semesters_by_year[year]):
+            position = self._timeline_position(year, index)
             del self.semesters_by_year[year][index]
             if not self.semesters_by_year[year]:
                 del self.semesters_by_year[year]
+            self._remove_from_series(position)
+
+    def clear(self):
+        self.semesters_by_year = {}
+        self._rebuild_series()
+
+    def get_semesters(self) -> List[Semester]:
+        # All semesters in chronological order
+        return list(self._timeline)
+
+    def get_semester_totals(self) -> List[Tuple[float, float]]:
+        # (points, credits) of each semester, aligned with get_semesters()
+        return list(self._semester_totals)
 
     def get_cumulative_gpa(self):
-        cum_points = 0.0
-        cum_credits = 0.0
-        for year, semesters in self.semesters_by_year.items():
-            for s in semesters:
-                _, points, credits = s.calculate_stats()
-                cum_points += points
-                cum_credits += credits
-        return (cum_points / cum_credits) if cum_credits > 0 else 0.0
+        if not self._cum_credits or self._cum_credits[-1] <= 0:
+            return 0.0
+        return self._cum_points[-1] / self._cum_credits[-1]
+
+    def get_cumulative_gpa_at(self, position: int) -> float:
+        # Running cumulative GPA after the semester at `position` in chronological order
+        credits = self._cum_credits[position]
+        return (self._cum_points[position] / credits) if credits > 0 else 0.0
+
+    def get_cumulative_gpa_series(self, year: Optional[str] = None) -> List[Tuple[Semester, float]]:
+        series = []
+        for position, semester in enumerate(self._timeline):
+            if year is None or semester.year == year:
+                series.append((semester, self.get_cumulative_gpa_at(position)))
+        return series
+
+    def get_cumulative_gpa_by_year(self) -> Dict[str, float]:
+        # Running cumulative GPA at the end of each year
+        result = {}
+        position = 0
+        for year in sorted(self.semesters_by_year.keys()):
+            position += len(self.semesters_by_year[year])
+            result[year] = self.get_cumulative_gpa_at(position - 1)
+        return result
 
     def load_data(self, data: dict):
         self.semesters_by_year = {}
@@ -100,6 +234,32 @@ class GradeManager:
             self.semesters_by_year[year] = []
             for s_data in semesters_data:
                 self.semesters_by_year[year].append(Semester.from_dict(s_data, year))
+        self._rebuild_series()
+
+    def apply_data(self, data: dict) -> List[str]:
+        # Like load_data, but diffs per semester and only replaces the ones that
+        # changed, so untouched semesters keep their objects. Returns changed years.
+        # Parse the whole document first, so a malformed one raises before anything changes
+        new_by_year = {}
+        for year, semesters_data in data.items():
+            new_by_year[year] = [Semester.from_dict(s_data, year) for s_data in semesters_data]
+
+        changed_years = []
+        for year in list(self.semesters_by_year.keys()) + [y for y in new_by_year if y not in self.semesters_by_year]:
+            old_semesters = list(self.semesters_by_year.get(year, []))
+            new_semesters = new_by_year.get(year, [])
+            if [s.content_key() for s in old_semesters] == [s.content_key() for s in new_semesters]:
+                continue
+
+            changed_years.append(year)
+            for index, semester in enumerate(new_semesters):
+                if index >= len(old_semesters):
+                    self.add_semester(semester)
+                elif old_semesters[index].content_key() != semester.content_key():
+                    self.update_semester(semester, year, index)
+            for index in reversed(range(len(new_semesters), len(old_semesters))):
+                self.delete_semester(year, index)
+        return changed_years
 
     def get_data_as_dict(self):
         data = {}
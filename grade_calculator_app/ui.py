@@ -3,17 +3,27 @@ import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import base64
+import math
+import threading
+import time
 from io import BytesIO
-from .models import GradeManager, Semester, Course
-from .data_manager import DataManager
+from .models import GradeManager, Semester, Course, GPAAccumulator
+from .data_manager import DataManager, DataConflictError
+from .analytics import GradeAnalytics
 
 matplotlib.use('Agg')
 
 class GradeCalculatorUI:
+    # Delay before a credit keystroke is applied to the live GPA
+    CREDIT_DEBOUNCE_SECONDS = 0.25
+    # How often the data file is checked for changes made by other programs
+    WATCH_INTERVAL_SECONDS = 2.0
+
     def __init__(self, page: ft.Page, data_manager: DataManager):
         self.page = page
         self.data_manager = data_manager
         self.grade_manager = GradeManager()
+        self.analytics = GradeAnalytics(self.grade_manager)
         
         # Load initial data
         data = self.data_manager.load_data()
@@ -23,6 +33,13 @@ class GradeCalculatorUI:
         self.init_state()
         self.build_ui()
 
+        if self.data_manager.load_error:
+            self.page.snack_bar = ft.SnackBar(ft.Text(f"Could not read {self.data_manager.filepath} ({self.data_manager.load_error}). Starting empty; saving will replace it."))
+            self.page.snack_bar.open = True
+            self.page.update()
+
+        threading.Thread(target=self.watch_data_file, daemon=True).start()
+
     def setup_page(self):
         self.page.title = "Grade Calculator"
         self.page.window_width = 800
@@ -66,6 +83,15 @@ class GradeCalculatorUI:
             "year": None,
             "index": None
         }
+        # Live GPA of the course rows, keyed by id(row)
+        self.live_gpa = GPAAccumulator()
+        # Pending credit edits: { id(row): (timer, apply) }
+        self.credit_timers = {}
+        # Debounce timers fire on their own threads, so the accumulator and
+        # the timer dict are only touched while holding this lock
+        self.live_gpa_lock = threading.RLock()
+        # Serializes history changes between UI handlers and the file watcher
+        self.sync_lock = threading.RLock()
 
     def build_ui(self):
         # --- Calculator Tab Components ---
@@ -87,6 +113,7 @@ class GradeCalculatorUI:
         )
 
         self.history_column = ft.Column(spacing=10)
+        self.history_year_controls = {}
         self.cumulative_result_text = ft.Text("Cumulative GPA: 0.00", size=20, weight="bold", color=ft.Colors.GREEN)
 
         # Buttons
@@ -175,6 +202,12 @@ class GradeCalculatorUI:
             value="All Years",
             on_change=self.generate_charts
         )
+        self.export_format_dropdown = ft.Dropdown(
+            label="Export Format",
+            width=150,
+            options=[ft.dropdown.Option("CSV"), ft.dropdown.Option("JSONL"), ft.dropdown.Option("Parquet")],
+            value="CSV"
+        )
 
         dashboard_view = ft.Column(
             controls=[
@@ -188,6 +221,10 @@ class GradeCalculatorUI:
                     ft.ElevatedButton("Refresh", icon=ft.Icons.REFRESH, on_click=self.generate_charts),
                     ft.ElevatedButton("Download Chart", icon=ft.Icons.DOWNLOAD, on_click=self.download_chart)
                 ], alignment=ft.MainAxisAlignment.CENTER),
+                ft.Row([
+                    self.export_format_dropdown,
+                    ft.ElevatedButton("Export Data", icon=ft.Icons.FILE_DOWNLOAD, on_click=self.export_data)
+                ], alignment=ft.MainAxisAlignment.CENTER),
                 ft.Divider(),
                 ft.Container(
                     content=self.dashboard_image,
@@ -230,21 +267,51 @@ class GradeCalculatorUI:
 
     # --- Calculator Methods ---
 
-    def create_course_row(self):
+    def create_course_row(self, name=None, credits=None, grade=None):
         row = ft.Row(alignment=ft.MainAxisAlignment.CENTER)
+        key = id(row)
         
         def delete_row(e):
+            with self.live_gpa_lock:
+                self.cancel_credit_timer(key)
+                self.live_gpa.remove(key)
             self.course_rows.controls.remove(row)
+            self.render_live_gpa()
             self.page.update()
 
-        name_field = ft.TextField(label="Course Name", expand=3, text_size=14, content_padding=10)
-        credit_field = ft.TextField(label="Credits", expand=1, text_size=14, content_padding=10, keyboard_type=ft.KeyboardType.NUMBER)
+        def on_grade_change(e):
+            # Applies the current credit value too, so a pending credit edit is redundant
+            with self.live_gpa_lock:
+                self.cancel_credit_timer(key)
+                changed = self.apply_row_change(key, None, credit_field.value, grade_dropdown.value)
+            if changed:
+                self.refresh_live_gpa()
+
+        def on_credit_change(e):
+            # Debounce keystrokes; only the last value in a burst is applied
+            def apply():
+                return self.apply_row_change(key, timer, credit_field.value, grade_dropdown.value)
+
+            def on_timer():
+                if apply():
+                    self.refresh_live_gpa()
+
+            with self.live_gpa_lock:
+                self.cancel_credit_timer(key)
+                timer = threading.Timer(self.CREDIT_DEBOUNCE_SECONDS, on_timer)
+                self.credit_timers[key] = (timer, apply)
+                timer.start()
+
+        name_field = ft.TextField(label="Course Name", value=name, expand=3, text_size=14, content_padding=10)
+        credit_field = ft.TextField(label="Credits", value=credits, expand=1, text_size=14, content_padding=10, keyboard_type=ft.KeyboardType.NUMBER, on_change=on_credit_change)
         grade_dropdown = ft.Dropdown(
             expand=1,
             label="Grade",
+            value=grade,
             text_size=14,
             content_padding=10,
-            options=[ft.dropdown.Option(g) for g in Course.GRADE_VALUES.keys()]
+            options=[ft.dropdown.Option(g) for g in Course.GRADE_VALUES.keys()],
+            on_change=on_grade_change
         )
         delete_btn = ft.IconButton(
             icon=ft.Icons.DELETE,
@@ -253,12 +320,76 @@ class GradeCalculatorUI:
         )
 
         row.controls = [name_field, credit_field, grade_dropdown, delete_btn]
+        self.set_row_contribution(key, credits, grade)
         return row
 
     def add_course_field(self, e):
         self.course_rows.controls.append(self.create_course_row())
         self.page.update()
 
+    def clear_course_rows(self):
+        with self.live_gpa_lock:
+            for timer, _ in self.credit_timers.values():
+                timer.cancel()
+            self.credit_timers.clear()
+            self.live_gpa.clear()
+        self.course_rows.controls.clear()
+
+    def cancel_credit_timer(self, key):
+        with self.live_gpa_lock:
+            pending = self.credit_timers.pop(key, None)
+            if pending:
+                pending[0].cancel()
+
+    def flush_credit_timers(self):
+        # Apply debounced credit edits now; only rows with a pending edit are touched
+        with self.live_gpa_lock:
+            for timer, apply in list(self.credit_timers.values()):
+                timer.cancel()
+                apply()
+
+    def parse_course_inputs(self, credit_value, grade_value):
+        # Shared by the live GPA and saving, so both count the same rows
+        if not credit_value or not grade_value:
+            return None
+        try:
+            credits = float(credit_value)
+        except (ValueError, TypeError):
+            return None
+        if not math.isfinite(credits):
+            return None
+        return credits, grade_value
+
+    def set_row_contribution(self, key, credit_value, grade_value):
+        parsed = self.parse_course_inputs(credit_value, grade_value)
+        credits, grade = parsed if parsed else (0.0, None)
+        with self.live_gpa_lock:
+            self.live_gpa.set(key, credits, grade)
+
+    def apply_row_change(self, key, timer, credit_value, grade_value):
+        # `timer` is the debounce timer applying this change, or None for direct edits
+        with self.live_gpa_lock:
+            if timer is not None:
+                # Superseded by a newer keystroke, or cancelled after it started firing
+                pending = self.credit_timers.get(key)
+                if pending is None or pending[0] is not timer:
+                    return False
+                del self.credit_timers[key]
+            # Row may have been deleted while a debounced edit was pending
+            if key not in self.live_gpa.contributions:
+                return False
+            self.set_row_contribution(key, credit_value, grade_value)
+            return True
+
+    def render_live_gpa(self):
+        with self.live_gpa_lock:
+            gpa = self.live_gpa.gpa
+        self.result_text.value = f"GPA: {gpa:.2f}"
+
+    def refresh_live_gpa(self):
+        self.render_live_gpa()
+        self.result_text.update()
+
     def get_current_semester_from_ui(self):
         sem_name = self.semester_name_field.value
         year = self.year_dropdown.value
@@ -269,29 +400,19 @@ class GradeCalculatorUI:
             credit_field = row.controls[1]
             grade_dropdown = row.controls[2]
             
-            try:
-                if not credit_field.value or not grade_dropdown.value:
-                    continue
+            parsed = self.parse_course_inputs(credit_field.value, grade_dropdown.value)
+            if not parsed:
+                continue
 
-                credits = float(credit_field.value)
-                grade = grade_dropdown.value
-                name = name_field.value
-                
-                semester.add_course(Course(name, credits, grade))
-            except (ValueError, TypeError):
-                continue 
+            credits, grade = parsed
+            semester.add_course(Course(name_field.value, credits, grade))
         
         return semester
 
     def calculate_gpa_handler(self, e):
-        semester = self.get_current_semester_from_ui()
-        gpa, _, total_credits = semester.calculate_stats()
-        
-        if total_credits > 0:
-            self.result_text.value = f"GPA: {gpa:.2f}"
-        else:
-            self.result_text.value = "GPA: 0.00"
-        
+        # Row handlers keep the totals current, so only pending credit edits need applying
+        self.flush_credit_timers()
+        self.render_live_gpa()
         self.page.update()
 
     def save_semester_handler(self, e):
@@ -304,68 +425,83 @@ class GradeCalculatorUI:
             self.page.update()
             return
 
-        if self.editing_state["is_editing"]:
-            self.grade_manager.update_semester(
-                semester, 
-                self.editing_state["year"], 
-                self.editing_state["index"]
-            )
-            self.page.snack_bar = ft.SnackBar(ft.Text(f"Updated {semester.name} in {semester.year}"))
-        else:
-            self.grade_manager.add_semester(semester)
-            self.page.snack_bar = ft.SnackBar(ft.Text(f"Saved {semester.name} to {semester.year}"))
-        
-        self.data_manager.save_data(self.grade_manager.get_data_as_dict())
-        self.refresh_history_view()
-        self.update_cumulative_gpa_display()
+        with self.sync_lock:
+            # Pick up other writers' changes first so they aren't overwritten
+            was_editing = self.editing_state["is_editing"]
+            self.check_external_changes()
+            if was_editing and not self.editing_state["is_editing"]:
+                # Never turn an update into an add; let the user decide what to do
+                self.page.snack_bar = ft.SnackBar(ft.Text("The semester you were editing was changed or removed by another program. Nothing was saved; check the history and try again."))
+                self.page.snack_bar.open = True
+                self.page.update()
+                return
+            snapshot = self.grade_manager.get_data_as_dict()
+            changed_years = {semester.year}
+
+            if self.editing_state["is_editing"]:
+                changed_years.add(self.editing_state["year"])
+                self.grade_manager.update_semester(
+                    semester, 
+                    self.editing_state["year"], 
+                    self.editing_state["index"]
+                )
+                self.page.snack_bar = ft.SnackBar(ft.Text(f"Updated {semester.name} in {semester.year}"))
+            else:
+                self.grade_manager.add_semester(semester)
+                self.page.snack_bar = ft.SnackBar(ft.Text(f"Saved {semester.name} to {semester.year}"))
+            
+            if not self.save_history(snapshot):
+                return
+            self.refresh_history_view(changed_years)
+            self.update_cumulative_gpa_display()
         
         self.clear_all(None)
         self.page.snack_bar.open = True
         self.page.update()
 
     def edit_semester(self, year, index):
-        semesters = self.grade_manager.semesters_by_year.get(year, [])
-        if not semesters or index >= len(semesters):
-            return
+        with self.sync_lock:
+            semesters = self.grade_manager.semesters_by_year.get(year, [])
+            if not semesters or index >= len(semesters):
+                return
 
-        semester = semesters[index]
+            semester = semesters[index]
         
-        # Load data back into form
-        self.semester_name_field.value = semester.name
-        self.year_dropdown.value = semester.year
+            # Load data back into form
+            self.semester_name_field.value = semester.name
+            self.year_dropdown.value = semester.year
         
-        self.course_rows.controls.clear()
-        for course in semester.courses:
-            row = self.create_course_row()
-            row.controls[0].value = course.name
-            row.controls[1].value = str(course.credits)
-            row.controls[2].value = course.grade
-            self.course_rows.controls.append(row)
+            self.clear_course_rows()
+            for course in semester.courses:
+                self.course_rows.controls.append(self.create_course_row(course.name, str(course.credits), course.grade))
             
-        # Set editing state
-        self.editing_state["is_editing"] = True
-        self.editing_state["year"] = year
-        self.editing_state["index"] = index
+            # Set editing state
+            self.editing_state["is_editing"] = True
+            self.editing_state["year"] = year
+            self.editing_state["index"] = index
         
-        self.save_btn.text = "Update Semester"
-        self.save_btn.icon = ft.Icons.UPDATE
+            self.save_btn.text = "Update Semester"
+            self.save_btn.icon = ft.Icons.UPDATE
         
-        self.calculate_gpa_handler(None)
+            self.calculate_gpa_handler(None)
         self.page.update()
 
     def delete_semester(self, year, index):
-        self.grade_manager.delete_semester(year, index)
-        self.data_manager.save_data(self.grade_manager.get_data_as_dict())
-        self.refresh_history_view()
-        self.update_cumulative_gpa_display()
+        with self.sync_lock:
+            snapshot = self.grade_manager.get_data_as_dict()
+            self.grade_manager.delete_semester(year, index)
+            if not self.save_history(snapshot):
+                return
+            self.refresh_history_view([year])
+            self.update_cumulative_gpa_display()
         self.page.update()
 
     def clear_all(self, e):
         self.semester_name_field.value = "Semester 1"
-        self.course_rows.controls.clear()
+        self.clear_course_rows()
         for _ in range(4):
             self.add_course_field(None)
-        self.result_text.value = "GPA: 0.00"
+        self.render_live_gpa()
         
         self.editing_state = {"is_editing": False, "year": None, "index": None}
         self.save_btn.text = "Save Semester"
@@ -374,64 +510,164 @@ class GradeCalculatorUI:
         self.page.update()
 
     def clear_history(self, e):
-        self.grade_manager.semesters_by_year.clear()
-        self.data_manager.save_data({})
-        self.refresh_history_view()
+        with self.sync_lock:
+            snapshot = self.grade_manager.get_data_as_dict()
+            self.grade_manager.clear()
+            if not self.save_history(snapshot):
+                return
+            self.refresh_history_view()
+            self.update_cumulative_gpa_display()
+        self.page.update()
+
+    def save_history(self, snapshot):
+        # `snapshot` is the history as it was before the change being saved
+        try:
+            self.data_manager.save_data(self.grade_manager.get_data_as_dict())
+            return True
+        except DataConflictError:
+            # Another program wrote the file since we last synced: take its version
+            # instead of overwriting it, and leave the form so the user can retry.
+            if self.check_external_changes():
+                message = "Data file was changed by another program and has been reloaded. Please try again."
+            else:
+                # Can't be read yet (e.g. mid-write): undo our unsaved change so
+                # memory still matches what we last synced
+                changed_years = self.grade_manager.apply_data(snapshot)
+                self.refresh_history_view(changed_years)
+                self.update_cumulative_gpa_display()
+                message = "Data file was changed by another program but could not be read. Nothing was saved; please try again."
+            self.page.snack_bar = ft.SnackBar(ft.Text(message))
+            self.page.snack_bar.open = True
+            self.page.update()
+            return False
+
+    def watch_data_file(self):
+        while True:
+            time.sleep(self.WATCH_INTERVAL_SECONDS)
+            try:
+                self.check_external_changes()
+            except Exception as ex:
+                print(f"Error checking data file: {ex}")
+
+    def check_external_changes(self):
+        with self.sync_lock:
+            changed = self.data_manager.poll_external_changes()
+            if changed is None:
+                return False
+            data, commit = changed
+            try:
+                self.apply_external_data(data)
+            except Exception as ex:
+                # Left uncommitted, so save_data keeps refusing to overwrite the file
+                print(f"Error applying changed data: {ex}")
+                return False
+            commit()
+            return True
+
+    def get_edited_semester_key(self):
+        if not self.editing_state["is_editing"]:
+            return None
+        semesters = self.grade_manager.semesters_by_year.get(self.editing_state["year"], [])
+        index = self.editing_state["index"]
+        return semesters[index].content_key() if 0 <= index < len(semesters) else None
+
+    def relocate_edited_semester(self, key):
+        # Point the editing state back at the semester with `key`; False if it is gone
+        semesters = self.grade_manager.semesters_by_year.get(self.editing_state["year"], [])
+        index = self.editing_state["index"]
+        if 0 <= index < len(semesters) and semesters[index].content_key() == key:
+            return True
+        for i, semester in enumerate(semesters):
+            if semester.content_key() == key:
+                self.editing_state["index"] = i
+                return True
+        return False
+
+    def apply_external_data(self, data):
+        edited_key = self.get_edited_semester_key()
+        changed_years = self.grade_manager.apply_data(data)
+        if not changed_years:
+            return
+
+        message = f"Reloaded changes to {', '.join(sorted(changed_years))} from disk"
+        if self.editing_state["is_editing"] and self.editing_state["year"] in changed_years:
+            if edited_key is None or not self.relocate_edited_semester(edited_key):
+                # The edited semester itself was changed or removed elsewhere
+                self.editing_state = {"is_editing": False, "year": None, "index": None}
+                self.save_btn.text = "Save Semester"
+                self.save_btn.icon = ft.Icons.SAVE
+                message += ". The semester you were editing was changed or removed; saving will now add it as a new semester."
+
+        self.refresh_history_view(changed_years)
         self.update_cumulative_gpa_display()
+        if self.tabs.selected_index == 1:
+            self.generate_charts(None)
+
+        self.page.snack_bar = ft.SnackBar(ft.Text(message))
+        self.page.snack_bar.open = True
+        self.page.update()
+
+    def refresh_history_view(self, years=None):
+        # Rebuild only the given years (all when None), then restore year order
+        with self.sync_lock:
+            if years is None:
+                self.history_year_controls = {}
+                years = self.grade_manager.semesters_by_year.keys()
+
+            for year in years:
+                if year in self.grade_manager.semesters_by_year:
+                    self.history_year_controls[year] = self.build_year_history(year)
+                else:
+                    self.history_year_controls.pop(year, None)
+
+            self.history_column.controls = [self.history_year_controls[y] for y in sorted(self.history_year_controls)]
         self.page.update()
 
-    def refresh_history_view(self):
-        self.history_column.controls.clear()
+    def build_year_history(self, year):
+        semesters = self.grade_manager.semesters_by_year[year]
         
-        sorted_years = sorted(self.grade_manager.semesters_by_year.keys())
+        year_semesters_column = ft.Column(spacing=5)
         
-        for year in sorted_years:
-            semesters = self.grade_manager.semesters_by_year[year]
+        for i, semester in enumerate(semesters):
+            gpa, _, credits = semester.calculate_stats()
             
-            year_semesters_column = ft.Column(spacing=5)
+            # Capture current values for closure
+            current_year = year
+            current_index = i
             
-            for i, semester in enumerate(semesters):
-                gpa, _, credits = semester.calculate_stats()
-                
-                # Capture current values for closure
-                current_year = year
-                current_index = i
-                
-                year_semesters_column.controls.append(
-                    ft.Container(
-                        content=ft.Row(
-                            controls=[
-                                ft.Column([
-                                    ft.Text(semester.name, weight="bold", color=ft.Colors.ON_SECONDARY_CONTAINER),
-                                    ft.Text(f"Credits: {credits:.1f} | GPA: {gpa:.2f}", size=12, color=ft.Colors.ON_SECONDARY_CONTAINER),
-                                ]),
-                                ft.Row([
-                                    ft.IconButton(ft.Icons.EDIT, icon_color=ft.Colors.PRIMARY, tooltip="Edit", on_click=lambda e, y=current_year, idx=current_index: self.edit_semester(y, idx)),
-                                    ft.IconButton(ft.Icons.DELETE, icon_color=ft.Colors.ERROR, tooltip="Delete", on_click=lambda e, y=current_year, idx=current_index: self.delete_semester(y, idx)),
-                                ])
-                            ],
-                            alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                        ),
-                        padding=10,
-                        bgcolor=ft.Colors.SECONDARY_CONTAINER,
-                        border_radius=5
-                    )
-                )
-            
-            self.history_column.controls.append(
+            year_semesters_column.controls.append(
                 ft.Container(
-                    content=ft.Column([
-                        ft.Text(year, size=16, weight="bold", color=ft.Colors.PRIMARY),
-                        year_semesters_column
-                    ]),
-                    padding=ft.padding.only(bottom=10)
+                    content=ft.Row(
+                        controls=[
+                            ft.Column([
+                                ft.Text(semester.name, weight="bold", color=ft.Colors.ON_SECONDARY_CONTAINER),
+                                ft.Text(f"Credits: {credits:.1f} | GPA: {gpa:.2f}", size=12, color=ft.Colors.ON_SECONDARY_CONTAINER),
+                            ]),
+                            ft.Row([
+                                ft.IconButton(ft.Icons.EDIT, icon_color=ft.Colors.PRIMARY, tooltip="Edit", on_click=lambda e, y=current_year, idx=current_index: self.edit_semester(y, idx)),
+                                ft.IconButton(ft.Icons.DELETE, icon_color=ft.Colors.ERROR, tooltip="Delete", on_click=lambda e, y=current_year, idx=current_index: self.delete_semester(y, idx)),
+                            ])
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+                    ),
+                    padding=10,
+                    bgcolor=ft.Colors.SECONDARY_CONTAINER,
+                    border_radius=5
                 )
             )
-        self.page.update()
+        
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(year, size=16, weight="bold", color=ft.Colors.PRIMARY),
+                year_semesters_column
+            ]),
+            padding=ft.padding.only(bottom=10)
+        )
 
     def update_cumulative_gpa_display(self):
-        cgpa = self.grade_manager.get_cumulative_gpa()
-        self.cumulative_result_text.value = f"Cumulative GPA: {cgpa:.2f}"
+        with self.sync_lock:
+            cgpa = self.grade_manager.get_cumulative_gpa()
+            self.cumulative_result_text.value = f"Cumulative GPA: {cgpa:.2f}"
 
     # --- Import Methods ---
 
@@ -449,7 +685,7 @@ class GradeCalculatorUI:
 
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         
-        self.course_rows.controls.clear()
+        self.clear_course_rows()
         
         i = 0
         while i < len(lines):
@@ -471,17 +707,13 @@ class GradeCalculatorUI:
             except:
                 credits = 0.0
 
-            row = self.create_course_row()
-            row.controls[0].value = f"{code} {name_en}"
-            row.controls[1].value = str(credits)
-            if grade in Course.GRADE_VALUES:
-                row.controls[2].value = grade
-            else:
-                row.controls[2].value = None
+            if grade not in Course.GRADE_VALUES:
+                grade = None
 
-            self.course_rows.controls.append(row)
+            self.course_rows.controls.append(self.create_course_row(f"{code} {name_en}", str(credits), grade))
             i += 5
         
+        self.render_live_gpa()
         self.import_text_field.value = ""
         self.close_import_dialog(None)
         self.page.snack_bar = ft.SnackBar(ft.Text("Data imported successfully!"))
@@ -491,81 +723,66 @@ class GradeCalculatorUI:
     # --- Dashboard Methods ---
 
     def generate_charts(self, e):
-        year_filter = self.dashboard_year_dropdown.value
-        
-        years = []
-        gpas = []
-        grade_counts = {}
+        # The file watcher updates the history from its own thread
+        with self.sync_lock:
+            year_filter = self.dashboard_year_dropdown.value
         
-        data = self.grade_manager.semesters_by_year
+            years = []
+            gpas = []
+            cumulative_gpas = []
         
-        if year_filter == "All Years":
-            sorted_years = sorted(data.keys())
-            for year in sorted_years:
-                semesters = data[year]
-                total_points = 0
-                total_credits = 0
-                for s in semesters:
-                    _, p, c = s.calculate_stats()
-                    total_points += p
-                    total_credits += c
-                    
-                    for course in s.courses:
-                        if course.grade:
-                            grade_counts[course.grade] = grade_counts.get(course.grade, 0) + 1
-                
-                if total_credits > 0:
+            if year_filter == "All Years":
+                cumulative_by_year = self.grade_manager.get_cumulative_gpa_by_year()
+                for year, gpa in self.analytics.gpa_by_year().items():
                     years.append(year)
-                    gpas.append(total_points / total_credits)
-        else:
-            if year_filter in data:
-                semesters = data[year_filter]
-                for s in semesters:
-                    gpa, _, _ = s.calculate_stats()
-                    years.append(s.name)
                     gpas.append(gpa)
-                    
-                    for course in s.courses:
-                        if course.grade:
-                            grade_counts[course.grade] = grade_counts.get(course.grade, 0) + 1
+                    cumulative_gpas.append(cumulative_by_year[year])
+                grade_counts = self.analytics.grade_distribution()
+            else:
+                semesters = self.analytics.semester_gpas(year_filter)
+                years = semesters["semester"].tolist()
+                gpas = semesters["gpa"].tolist()
+                cumulative_gpas = [self.grade_manager.get_cumulative_gpa_at(p) for p in semesters["position"]]
+                grade_counts = self.analytics.grade_distribution(year_filter)
         
-        if not years and not grade_counts:
-            self.dashboard_image.src_base64 = ""
-            self.dashboard_image.update()
-            return
-
-        sns.set_theme(style="whitegrid")
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 10))
-        fig.subplots_adjust(hspace=0.4)
+            if not years and grade_counts.empty:
+                self.dashboard_image.src_base64 = ""
+                self.dashboard_image.update()
+                return
+
+            sns.set_theme(style="whitegrid")
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 10))
+            fig.subplots_adjust(hspace=0.4)
         
-        if years:
-            sns.lineplot(x=years, y=gpas, ax=ax1, marker='o')
-            ax1.set_title(f'GPA Summary ({year_filter})')
-            ax1.set_ylabel('GPA')
-            ax1.set_ylim(0, 4.0)
-            for i, v in enumerate(gpas):
-                ax1.text(i, v, f'{v:.2f}', ha='center', va='bottom')
-        else:
-            ax1.text(0.5, 0.5, 'No GPA Data', ha='center', va='center')
-
-        if grade_counts:
-            labels = list(grade_counts.keys())
-            sizes = list(grade_counts.values())
-            colors = sns.color_palette('pastel')[0:len(labels)]
-            ax2.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-            ax2.axis('equal')
-            ax2.set_title('Grade Distribution')
-        else:
-            ax2.text(0.5, 0.5, 'No Grade Data', ha='center', va='center')
+            if years:
+                sns.lineplot(x=years, y=gpas, ax=ax1, marker='o', label='GPA')
+                sns.lineplot(x=years, y=cumulative_gpas, ax=ax1, marker='s', linestyle='--', label='Cumulative GPA')
+                ax1.set_title(f'GPA Summary ({year_filter})')
+                ax1.set_ylabel('GPA')
+                ax1.set_ylim(0, 4.0)
+                for i, v in enumerate(gpas):
+                    ax1.text(i, v, f'{v:.2f}', ha='center', va='bottom')
+            else:
+                ax1.text(0.5, 0.5, 'No GPA Data', ha='center', va='center')
+
+            if not grade_counts.empty:
+                labels = grade_counts.index.tolist()
+                sizes = grade_counts.tolist()
+                colors = sns.color_palette('pastel')[0:len(labels)]
+                ax2.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+                ax2.axis('equal')
+                ax2.set_title('Grade Distribution')
+            else:
+                ax2.text(0.5, 0.5, 'No Grade Data', ha='center', va='center')
 
-        buf = BytesIO()
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
+            buf = BytesIO()
+            plt.savefig(buf, format='png')
+            buf.seek(0)
+            img_str = base64.b64encode(buf.read()).decode('utf-8')
+            plt.close(fig)
         
-        self.dashboard_image.src_base64 = img_str
-        self.dashboard_image.update()
+            self.dashboard_image.src_base64 = img_str
+            self.dashboard_image.update()
 
     def download_chart(self, e):
         if not self.dashboard_image.src_base64:
@@ -585,3 +802,25 @@ class GradeCalculatorUI:
             self.page.update()
         except Exception as ex:
             print(f"Error saving chart: {ex}")
+
+    def export_data(self, e):
+        if not self.grade_manager.semesters_by_year:
+            self.page.snack_bar = ft.SnackBar(ft.Text("No data to export!"))
+            self.page.snack_bar.open = True
+            self.page.update()
+            return
+
+        fmt = self.export_format_dropdown.value.lower()
+        try:
+            filenames = []
+            with self.sync_lock:
+                for level in ("course", "semester"):
+                    filename = f"grade_export_{level}s.{fmt}"
+                    self.data_manager.export_data(self.grade_manager, filename, fmt, level)
+                    filenames.append(filename)
+
+            self.page.snack_bar = ft.SnackBar(ft.Text(f"Exported to {', '.join(filenames)}"))
+        except Exception as ex:
+            self.page.snack_bar = ft.SnackBar(ft.Text(f"Export failed: {ex}"))
+        self.page.snack_bar.open = True
+        self.page.update()